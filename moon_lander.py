@@ -1,6 +1,13 @@
 import pygame
-import math
+from math import sin, cos, radians
 import random
+from dataclasses import dataclass
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # Initialize Pygame
 pygame.init()
@@ -8,12 +15,11 @@ pygame.init()
 # Constants
 WIDTH, HEIGHT = 800, 600
 FPS = 60
-GRAVITY = 0.01
 THRUST = 0.2
 ROTATION_SPEED = 3
+ROTATION_SPEED_RAD = radians(ROTATION_SPEED)
+ROTATION_STEPS = 360 // ROTATION_SPEED  # Rotation steps in a full turn
 FUEL_CONSUMPTION = 0.2
-LEVEL = 1  # Initial level
-LIVES = 3  # Initial lives
 
 INPUT_DELAY = 300
 
@@ -25,181 +31,279 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 GRAY = (128, 128, 128)
 
+# Per-game state; reset on game over
+@dataclass(slots=True)
+class GameState:
+    gravity: float = 0.01  # Initial gravity, raised each level
+    level: int = 1  # Initial level
+    lives: int = 3  # Initial lives
+
 # Set up the display
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+# Pace frames with vsync where available; SCALED is needed for pygame to honor vsync
+screen = pygame.display.set_mode((WIDTH, HEIGHT), flags=pygame.SCALED, vsync=1)
 pygame.display.set_caption("Moon Lander")
 clock = pygame.time.Clock()
+HUD_FONT = pygame.font.SysFont(None, 24)  # Built once; SysFont scans system fonts
+
+@njit(cache=True, fastmath=True)
+def step_physics(x, y, velocity_x, velocity_y, fuel, sin_a, cos_a, thrusting, gravity, width):
+    # Apply gravity
+    velocity_y += gravity
+
+    # Apply thrust if fuel available
+    if thrusting and fuel > 0:
+        velocity_x += sin_a * THRUST
+        velocity_y -= cos_a * THRUST
+        fuel = max(0.0, fuel - FUEL_CONSUMPTION)
+
+    # Update position
+    x += velocity_x
+    y += velocity_y
+
+    # Horizontal screen boundaries
+    x = max(0.0, min(WIDTH - width, x))
+    return x, y, velocity_x, velocity_y, fuel
+
+# Compile the kernel up front so the first frame doesn't stall on JIT
+step_physics(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, True, GameState().gravity, 20)
 
 class Lander:
+    # angle is a property derived from _angle_steps, so it has no slot
+    __slots__ = (
+        "x", "y", "velocity_x", "velocity_y", "_angle_steps", "_angle_rad", "_sin", "_cos", "fuel",
+        "landed", "crashed", "width", "height", "_half_w", "landing_pad_x", "pad_rect",
+        "landing_time", "_terrain_surface", "_local_tri", "_rotated_local",
+        "_last_fuel", "_fuel_text", "_last_velocity", "_velocity_text",
+        "_last_angle", "_angle_text",
+    )
+    _FLAME_OFFSETS = ((0, 0), (5, 15), (-5, 15))  # Flame triangle relative to the lander's bottom center
+
     def __init__(self):
-        self.x = WIDTH // 2
-        self.y = 100
-        self.velocity_x = 0
-        self.velocity_y = 0
-        self.angle = 0
-        self.fuel = 100
+        self.x = float(WIDTH // 2)
+        self.y = 100.0
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+        self._angle_steps = 0  # Heading in whole rotation steps, kept in [0, ROTATION_STEPS)
+        self._angle_rad = 0.0  # Derived from _angle_steps; never accumulated
+        self._sin = 0.0  # Cached sin/cos of the angle, refreshed only when rotating
+        self._cos = 1.0
+        self.fuel = 100.0
         self.landed = False
         self.crashed = False
         self.width = 20
         self.height = 30
+        self._half_w = self.width // 2
         self.landing_pad_x = random.randint(100, WIDTH - 100)  # Random landing pad position
+        self.pad_rect = pygame.Rect(self.landing_pad_x - 50, HEIGHT - 50, 100, 5)  # Landing pad surface
         self.landing_time = 0  # Time when landing occurred
-
-    def update(self, thrusting, rotating_left, rotating_right):
-        global LIVES
-        if not self.landed and not self.crashed:
-            # Apply gravity
-            self.velocity_y += GRAVITY
-
-            # Apply thrust if fuel available
-            if thrusting and self.fuel > 0:
-                self.velocity_x += math.sin(math.radians(self.angle)) * THRUST
-                self.velocity_y -= math.cos(math.radians(self.angle)) * THRUST
-                self.fuel = max(0, self.fuel - FUEL_CONSUMPTION)
-
-            # Handle rotation
-            if rotating_left:
-                self.angle = (self.angle + ROTATION_SPEED) % 360
-            if rotating_right:
-                self.angle = (self.angle - ROTATION_SPEED) % 360
-
-            # Update position
-            self.x += self.velocity_x
-            self.y += self.velocity_y
-
-            # Check for landing or crash
-            if self.y + self.height >= HEIGHT - 50:  # Landing platform height
-                # Check if we're over the landing pad
-                if (self.landing_pad_x - 50 <= self.x + self.width//2 <= self.landing_pad_x + 50 and 
-                    abs(self.velocity_x) < 2 and abs(self.velocity_y) < 2):
-                    # Normalize angle to be between -180 and 180 degrees
-                    normalized_angle = (self.angle + 180) % 360 - 180
-                    if abs(normalized_angle) < 15:
-                        self.landed = True
-                        self.landing_time = pygame.time.get_ticks()  # Record landing time
-                    else:
-                        self.crashed = True
-                        LIVES -= 1
-                else:
-                    self.crashed = True
-                    LIVES -= 1
-
-            # Screen boundaries
-            self.x = max(0, min(WIDTH - self.width, self.x))
-            if self.y < 0:
-                self.y = 0
-                self.velocity_y = 0
-
-    def draw(self, screen):
-        # Draw lander
-        points = [
-            (self.x + self.width//2, self.y),
-            (self.x + self.width, self.y + self.height),
-            (self.x, self.y + self.height)
+        self._terrain_surface = self._build_terrain_surface()
+        # Lander triangle as offsets from its center, plus the rotated copy used for drawing
+        self._local_tri = [
+            (0, -(self.height//2)),
+            (self.width - self.width//2, self.height - self.height//2),
+            (-(self.width//2), self.height - self.height//2)
         ]
-        
-        # Rotate points around center
+        self._rotated_local = list(self._local_tri)
+        # Values behind the last HUD readouts and their rendered text
+        self._last_fuel = None
+        self._fuel_text = None
+        self._last_velocity = None
+        self._velocity_text = None
+        self._last_angle = None
+        self._angle_text = None
+
+    @property
+    def angle(self):
+        # Whole degrees, as shown on the HUD
+        return self._angle_steps * ROTATION_SPEED
+
+    def _build_terrain_surface(self):
+        # Terrain is static for the whole round, so render it once and blit it each frame
+        surface = pygame.Surface((WIDTH, 50))
+        surface.fill(GRAY)
+        pygame.draw.rect(surface, GREEN, (self.landing_pad_x - 50, 0, 100, 5))
+        return surface
+
+    def _rotate_local_tri(self):
+        sin_a, cos_a = self._sin, self._cos
+        self._rotated_local = [(x * cos_a - y * sin_a, x * sin_a + y * cos_a) for x, y in self._local_tri]
+
+    def update(self, state, thrusting, rotating_left, rotating_right, now):
+        if self.landed or self.crashed:
+            return
+
+        self.x, self.y, self.velocity_x, self.velocity_y, self.fuel = step_physics(
+            self.x, self.y, self.velocity_x, self.velocity_y, self.fuel,
+            self._sin, self._cos, thrusting, state.gravity, self.width)
+
+        # Handle rotation
+        # One step never leaves [-1, ROTATION_STEPS], so a single compare wraps it
+        if rotating_left:
+            a = self._angle_steps + 1
+            self._angle_steps = a - ROTATION_STEPS if a >= ROTATION_STEPS else a
+        if rotating_right:
+            a = self._angle_steps - 1
+            self._angle_steps = a + ROTATION_STEPS if a < 0 else a
+        if rotating_left or rotating_right:
+            self._angle_rad = self._angle_steps * ROTATION_SPEED_RAD
+            self._sin = sin(self._angle_rad)
+            self._cos = cos(self._angle_rad)
+            self._rotate_local_tri()
+
+        # Check for landing or crash
+        if self.y + self.height >= HEIGHT - 50:  # Landing platform height
+            # Over the pad, slow enough (speed < 2) and upright (within 15 degrees)?
+            on_pad = self.pad_rect.collidepoint(int(self.x + self._half_w), HEIGHT - 50)
+            slow = self.velocity_x * self.velocity_x + self.velocity_y * self.velocity_y < 4
+            # Normalize angle to be between -180 and 180 degrees
+            a = self.angle
+            a = a - 360 if a > 180 else a
+            if on_pad and slow and -15 < a < 15:
+                self.landed = True
+                self.landing_time = now  # Record landing time
+            else:
+                self.crashed = True
+                state.lives -= 1
+
+        # Top screen boundary
+        if self.y < 0:
+            self.y = 0.0
+            self.velocity_y = 0.0
+
+    def draw(self, screen, thrusting):
+        # Draw lander, translating the cached rotated triangle to its center
         center_x = self.x + self.width//2
         center_y = self.y + self.height//2
-        rotated_points = []
-        for x, y in points:
-            # Translate to origin
-            x -= center_x
-            y -= center_y
-            # Rotate
-            new_x = x * math.cos(math.radians(self.angle)) - y * math.sin(math.radians(self.angle))
-            new_y = x * math.sin(math.radians(self.angle)) + y * math.cos(math.radians(self.angle))
-            # Translate back
-            rotated_points.append((new_x + center_x, new_y + center_y))
-        
-        pygame.draw.polygon(screen, WHITE, rotated_points)
+        rotated_points = [(x + center_x, y + center_y) for x, y in self._rotated_local]
+
+        dirty = [pygame.draw.polygon(screen, WHITE, rotated_points)]
 
         # Draw flame if thrusting
-        if pygame.key.get_pressed()[pygame.K_UP] and self.fuel > 0:
-            flame_points = [
-                (self.x + self.width//2, self.y + self.height),
-                (self.x + self.width//2 + 5, self.y + self.height + 15),
-                (self.x + self.width//2 - 5, self.y + self.height + 15)
-            ]
-            pygame.draw.polygon(screen, RED, flame_points)
+        if thrusting and self.fuel > 0:
+            bx = self.x + self._half_w
+            by = self.y + self.height
+            dirty.append(pygame.draw.polygon(screen, RED, [(bx + dx, by + dy) for dx, dy in self._FLAME_OFFSETS]))
+        return dirty  # Screen areas touched, for the dirty-rect update
 
 def draw_terrain(screen, lander):
     # Simple terrain with a landing platform
-    pygame.draw.rect(screen, GRAY, (0, HEIGHT - 50, WIDTH, 50))
-    pygame.draw.rect(screen, GREEN, (lander.landing_pad_x - 50, HEIGHT - 50, 100, 5))
+    screen.blit(lander._terrain_surface, (0, HEIGHT - 50))
+
+# Rendered HUD text surfaces keyed by (text, color)
+TEXT_CACHE_SIZE = 256
+_text_cache = {}
+
+def render_cached(text, color=WHITE):
+    key = (text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _text_cache[next(iter(_text_cache))]
+        surface = HUD_FONT.render(text, True, color)
+        _text_cache[key] = surface
+    return surface
 
 def draw_hud(screen, lander):
-    font = pygame.font.SysFont(None, 24)
-    
-    # Level
-    level_text = font.render(f"Level: {LEVEL}", True, WHITE)
-    screen.blit(level_text, (10, 10))
-    
-    # Lives
-    lives_text = font.render(f"Lives: {LIVES}", True, WHITE)
-    screen.blit(lives_text, (10, 40))
-    
-    # Fuel gauge
-    fuel_text = font.render(f"Fuel: {lander.fuel:.1f}", True, WHITE)
-    screen.blit(fuel_text, (10, 70))
-    
-    # Velocity
-    velocity_text = font.render(f"Velocity X: {lander.velocity_x:.1f} Y: {lander.velocity_y:.1f}", True, WHITE)
-    screen.blit(velocity_text, (10, 100))
-    
-    # Angle
-    angle_text = font.render(f"Angle: {lander.angle:.1f}°", True, WHITE)
-    screen.blit(angle_text, (10, 130))
-    
-    # Gravity
-    gravity_text = font.render(f"Gravity: {GRAVITY:.3f}", True, WHITE)
-    screen.blit(gravity_text, (10, 160))
-    
+    # Only format the lander readouts again when the values behind them change
+    if lander.fuel != lander._last_fuel:
+        lander._last_fuel = lander.fuel
+        lander._fuel_text = render_cached(f"Fuel: {lander.fuel:.1f}")
+    velocity = (lander.velocity_x, lander.velocity_y)
+    if velocity != lander._last_velocity:
+        lander._last_velocity = velocity
+        lander._velocity_text = render_cached(f"Velocity X: {lander.velocity_x:.1f} Y: {lander.velocity_y:.1f}")
+    angle = lander.angle
+    if angle != lander._last_angle:
+        lander._last_angle = angle
+        lander._angle_text = render_cached(f"Angle: {angle:.1f}°")
+
+    # Blit the changing readouts in a single call and return the areas they cover
+    return screen.blits([
+        (lander._fuel_text, (10, 70)),  # Fuel gauge
+        (lander._velocity_text, (10, 100)),
+        (lander._angle_text, (10, 130)),
+    ])
+
+def hud_labels(lander, state):
+    # HUD text that only changes between rounds or when the round ends, as (surface, rect) pairs
+    blit_list = [
+        (render_cached(f"Level: {state.level}"), (10, 10)),
+        (render_cached(f"Lives: {state.lives}"), (10, 40)),
+        (render_cached(f"Gravity: {state.gravity:.3f}"), (10, 160)),
+    ]
+
     # Game state
     if lander.landed:
-        success_text = font.render("LANDING SUCCESSFUL!", True, GREEN)
-        screen.blit(success_text, (WIDTH//2 - 100, HEIGHT//2))
-        retry_text = font.render("Press any key for next level", True, WHITE)
-        screen.blit(retry_text, (WIDTH//2 - 100, HEIGHT//2 + 30))
+        blit_list.append((render_cached("LANDING SUCCESSFUL!", GREEN), (WIDTH//2 - 100, HEIGHT//2)))
+        blit_list.append((render_cached("Press any key for next level"), (WIDTH//2 - 100, HEIGHT//2 + 30)))
     elif lander.crashed:
-        if LIVES > 0:
-            crash_text = font.render("CRASHED!", True, RED)
-            screen.blit(crash_text, (WIDTH//2 - 50, HEIGHT//2))
-            retry_text = font.render("Press any key to try again", True, WHITE)
+        if state.lives > 0:
+            blit_list.append((render_cached("CRASHED!", RED), (WIDTH//2 - 50, HEIGHT//2)))
+            retry_text = render_cached("Press any key to try again")
         else:
-            game_over_text = font.render("GAME OVER", True, RED)
-            screen.blit(game_over_text, (WIDTH//2 - 50, HEIGHT//2))
-            retry_text = font.render("Press any key to play again", True, WHITE)
-            screen.blit(retry_text, (WIDTH//2 - 100, HEIGHT//2 + 30))
-        screen.blit(retry_text, (WIDTH//2 - 100, HEIGHT//2 + 30))
+            blit_list.append((render_cached("GAME OVER", RED), (WIDTH//2 - 50, HEIGHT//2)))
+            retry_text = render_cached("Press any key to play again")
+        blit_list.append((retry_text, (WIDTH//2 - 100, HEIGHT//2 + 30)))
+
+    return [(text, text.get_rect(topleft=pos)) for text, pos in blit_list]
+
+def build_background(lander, state):
+    # Everything that stays put during a round: sky and terrain, and a copy with the
+    # static HUD labels on top
+    terrain = pygame.Surface((WIDTH, HEIGHT))
+    terrain.fill(BLACK)
+    draw_terrain(terrain, lander)
+    labels = hud_labels(lander, state)
+    background = terrain.copy()
+    background.blits(labels, doreturn=False)
+    return terrain, background, labels
+
+def draw_lander(screen, lander, thrusting, terrain, labels):
+    drawn = lander.draw(screen, thrusting)
+    area = drawn[0].unionall(drawn[1:])
+    if area.collidelist([rect for _, rect in labels]) != -1:
+        # The lander went over labels baked into the background; redo that area
+        # bottom-up so the labels stay on top, as in a full redraw
+        screen.blit(terrain, area, area)
+        lander.draw(screen, thrusting)
+        screen.set_clip(area)
+        screen.blits(labels, doreturn=False)
+        screen.set_clip(None)
+    return drawn
 
 def main():
-    global GRAVITY, LEVEL, LIVES  # Make GRAVITY, LEVEL, and LIVES modifiable
+    state = GameState()
     lander = Lander()
     running = True
+    terrain = background = labels = None
+    background_key = None  # What the background was built for
+    dirty_rects = []  # Areas drawn over the background last frame
 
     while running:
-        # Event handling
-        for event in pygame.event.get():
+        now = pygame.time.get_ticks()  # Read the timer once per frame
+
+        # Event handling; only QUIT and KEYDOWN matter, so filter the rest in SDL
+        for event in pygame.event.get([pygame.QUIT, pygame.KEYDOWN]):
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
-                if LIVES <= 0:
+                if state.lives <= 0:
                     # Reset everything for a new game
-                    GRAVITY = 0.01
-                    LEVEL = 1
-                    LIVES = 3
+                    state = GameState()
                     lander = Lander()
-                elif (lander.crashed or lander.landed) and pygame.time.get_ticks() - lander.landing_time > INPUT_DELAY:
+                elif (lander.crashed or lander.landed) and now - lander.landing_time > INPUT_DELAY:
                     if lander.landed:
-                        GRAVITY += 0.01  # Increase gravity for next level
-                        LEVEL += 1  # Increase level
+                        state.gravity += 0.01  # Increase gravity for next level
+                        state.level += 1  # Increase level
                     lander = Lander()
+        # Drop the ignored events (mouse motion etc.) already pumped into the queue
+        pygame.event.clear(pump=False)
 
         # Get key states
         keys = pygame.key.get_pressed()
         # Ignore thrust and rotation inputs for 0.3 second after landing or if game over
-        if (not lander.landed or pygame.time.get_ticks() - lander.landing_time > INPUT_DELAY) and LIVES > 0:
+        if (not lander.landed or now - lander.landing_time > INPUT_DELAY) and state.lives > 0:
             thrusting = keys[pygame.K_UP] or keys[pygame.K_w]  # Up arrow or W
             rotating_left = keys[pygame.K_RIGHT] or keys[pygame.K_d]  # Right arrow or D
             rotating_right = keys[pygame.K_LEFT] or keys[pygame.K_a]  # Left arrow or A
@@ -209,17 +313,28 @@ def main():
             rotating_right = False
 
         # Update game state
-        if LIVES > 0:  # Only update if not game over
-            lander.update(thrusting, rotating_left, rotating_right)
-
-        # Draw everything
-        screen.fill(BLACK)
-        draw_terrain(screen, lander)
-        lander.draw(screen)
-        draw_hud(screen, lander)
+        if state.lives > 0:  # Only update if not game over
+            lander.update(state, thrusting, rotating_left, rotating_right, now)
 
-        pygame.display.flip()
-        clock.tick(FPS)
+        # Draw everything, pushing only the changed areas to the display
+        key = (lander, state.lives, lander.landed, lander.crashed)
+        if key != background_key:
+            # New round or round over: rebuild the background and show a full frame
+            background_key = key
+            terrain, background, labels = build_background(lander, state)
+            screen.blit(background, (0, 0))
+            drawn = draw_lander(screen, lander, thrusting, terrain, labels) + draw_hud(screen, lander)
+            pygame.display.flip()
+        else:
+            # Restore last frame's areas from the background, then redraw the moving parts
+            for rect in dirty_rects:
+                screen.blit(background, rect, rect)
+            drawn = draw_lander(screen, lander, thrusting, terrain, labels) + draw_hud(screen, lander)
+            # With the SCALED (renderer-backed) display pygame still presents the whole
+            # frame here, so this saves the redraw work but not display bandwidth
+            pygame.display.update(dirty_rects + drawn)
+        dirty_rects = drawn
+        clock.tick(FPS)  # Safety cap in case vsync is unavailable
 
     pygame.quit()
 
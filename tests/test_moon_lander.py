@@ -0,0 +1,94 @@
+import os
+import sys
+import unittest
+
+# Headless display so importing the game module doesn't open a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+import moon_lander  # noqa: E402
+
+
+class HudReadoutTest(unittest.TestCase):
+    def setUp(self):
+        self.lander = moon_lander.Lander()
+        self.screen = pygame.Surface((moon_lander.WIDTH, moon_lander.HEIGHT))
+
+    def assertDrawn(self, surface, text):
+        self.assertIs(surface, moon_lander.render_cached(text))
+
+    def test_velocity_text_matches_format(self):
+        for vy in (0.05, 0.15, 0.16, 0.24, 0.25, -0.04, 0.0, -0.04):
+            self.lander.velocity_y = vy
+            moon_lander.draw_hud(self.screen, self.lander)
+            self.assertDrawn(self.lander._velocity_text, f"Velocity X: {0.0:.1f} Y: {vy:.1f}")
+
+    def test_fuel_text_matches_format(self):
+        for fuel in (99.95, 99.85, 99.84, 0.0):
+            self.lander.fuel = fuel
+            moon_lander.draw_hud(self.screen, self.lander)
+            self.assertDrawn(self.lander._fuel_text, f"Fuel: {fuel:.1f}")
+
+
+class LanderRotationTest(unittest.TestCase):
+    def setUp(self):
+        self.lander = moon_lander.Lander()
+        self.state = moon_lander.GameState(gravity=0.0)
+
+    def rotate(self, left, right, frames):
+        for _ in range(frames):
+            self.lander.update(self.state, False, left, right, 0)
+
+    def test_rotating_back_returns_to_zero(self):
+        self.rotate(True, False, 3)
+        self.rotate(False, True, 3)
+        self.assertEqual(self.lander.angle, 0)
+        self.assertEqual(self.lander._angle_rad, 0.0)
+
+    def test_full_turn_returns_to_zero(self):
+        self.rotate(False, True, moon_lander.ROTATION_STEPS)
+        self.assertEqual(self.lander.angle, 0)
+        self.rotate(False, True, 1)
+        self.assertEqual(self.lander.angle, 360 - moon_lander.ROTATION_SPEED)
+
+    def touch_down(self, steps):
+        lander = moon_lander.Lander()
+        lander._angle_steps = steps
+        lander.x = float(lander.landing_pad_x - lander.width // 2)
+        lander.y = float(moon_lander.HEIGHT - 50 - lander.height)
+        lander.update(self.state, False, False, False, 0)
+        return lander
+
+    def test_fifteen_degree_tilt_crashes(self):
+        tilt = 15 // moon_lander.ROTATION_SPEED
+        for steps in (tilt, moon_lander.ROTATION_STEPS - tilt):
+            self.assertTrue(self.touch_down(steps).crashed)
+        for steps in (tilt - 1, moon_lander.ROTATION_STEPS - tilt + 1):
+            self.assertTrue(self.touch_down(steps).landed)
+
+
+class BackgroundTest(unittest.TestCase):
+    def full_redraw(self, lander, state, thrusting):
+        screen = pygame.Surface((moon_lander.WIDTH, moon_lander.HEIGHT))
+        screen.fill(moon_lander.BLACK)
+        moon_lander.draw_terrain(screen, lander)
+        lander.draw(screen, thrusting)
+        screen.blits(moon_lander.hud_labels(lander, state), doreturn=False)
+        return screen
+
+    def test_lander_stays_under_labels(self):
+        state = moon_lander.GameState()
+        lander = moon_lander.Lander()
+        lander.x, lander.y = 20.0, 5.0  # Over "Level", flame over the "Lives" label
+        terrain, background, labels = moon_lander.build_background(lander, state)
+        for thrusting in (False, True):
+            screen = background.copy()
+            moon_lander.draw_lander(screen, lander, thrusting, terrain, labels)
+            expected = self.full_redraw(lander, state, thrusting)
+            self.assertEqual(pygame.image.tobytes(screen, "RGB"), pygame.image.tobytes(expected, "RGB"))
+
+
+if __name__ == "__main__":
+    unittest.main()